@@ -24,11 +24,12 @@ import platform
 from moler.exceptions import MolerTimeout
 from moler.exceptions import MolerException
 from moler.exceptions import WrongUsage
-from moler.helpers import instance_id
+from moler.helpers import instance_id, effective_cpu_count
 from moler.util.connection_observer import exception_stored_if_not_main_thread
 from moler.io.raw import TillDoneThread
 from moler.runner import ConnectionObserverRunner
-from moler.runner import result_for_runners, time_out_observer, his_remaining_time, await_future_or_eol
+from moler.runner import time_out_observer, his_remaining_time, await_future_or_eol
+from moler.runner import FutureResultIterator
 from moler.util.loghelper import debug_into_logger
 
 
@@ -191,6 +192,7 @@ def cancel_remaining_feeders(loop, logger_name="moler.runner.asyncio", in_shutdo
 class AsyncioRunner(ConnectionObserverRunner):
     runner_lock = threading.Lock()
     last_runner_id = 0
+    _blocking_io_executor = None  # small pool shared by runners, for blocking calls made from inside event loop
 
     def __init__(self, logger_name='moler.runner.asyncio'):
         """Create instance of AsyncioRunner class"""
@@ -203,11 +205,14 @@ class AsyncioRunner(ConnectionObserverRunner):
         logging.getLogger("asyncio").setLevel(logging.DEBUG)
         self._submitted_futures = {}  # id(future): future
         self._started_ev_loops = []
+        self._max_feed_wait = 0.1  # max. sleep of feed() between checks of observer not signalled by runner events
+        self._feed_wakeups = {}  # asyncio.Event of running feed(): its event loop - set event to wake feed() up
         atexit.register(self.shutdown)
 
     def shutdown(self):
         self.logger.debug("shutting down")
         self._in_shutdown = True  # will exit from feed()
+        self._wakeup_feeders()
         # TODO: need wait for all feed() coros before closing owned event loops
 
         with AsyncioRunner.runner_lock:
@@ -280,11 +285,14 @@ class AsyncioRunner(ConnectionObserverRunner):
         if its_new:
             with AsyncioRunner.runner_lock:
                 self._started_ev_loops.append(event_loop)
-        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
+        feed_wakeup = asyncio.Event()  # wakes feed() when there is something to check
+        self._feed_wakeups[feed_wakeup] = event_loop
+        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock, feed_wakeup)
         self.logger.debug("scheduling feed({})".format(connection_observer))
         connection_observer_future = asyncio.ensure_future(self.feed(connection_observer,
                                                                      subscribed_data_receiver,
-                                                                     observer_lock),
+                                                                     observer_lock,
+                                                                     feed_wakeup),
                                                            loop=event_loop)
         self.logger.debug("runner submit() returning - future: {}:{}".format(instance_id(connection_observer_future),
                                                                              connection_observer_future))
@@ -527,7 +535,15 @@ class AsyncioRunner(ConnectionObserverRunner):
         # Here we know, connection_observer_future is asyncio.Future (precisely asyncio.tasks.Task)
         # and we know it has __await__() method.
 
-    def _start_feeding(self, connection_observer, observer_lock):
+    @classmethod
+    def _get_blocking_io_executor(cls):
+        with AsyncioRunner.runner_lock:
+            if AsyncioRunner._blocking_io_executor is None:
+                max_workers = min(32, effective_cpu_count() * 2)
+                AsyncioRunner._blocking_io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            return AsyncioRunner._blocking_io_executor
+
+    def _start_feeding(self, connection_observer, observer_lock, feed_wakeup=None, send_command=True):
         """
         Start feeding connection_observer by establishing data-channel from connection to observer.
         """
@@ -554,21 +570,26 @@ class AsyncioRunner(ConnectionObserverRunner):
                 with observer_lock:
                     connection_observer.set_exception(exc)
             finally:
-                if connection_observer.done() and not connection_observer.cancelled():
-                    if connection_observer._exception:
-                        self.logger.debug("{} raised: {!r}".format(connection_observer, connection_observer._exception))
-                    else:
-                        self.logger.debug("{} returned: {}".format(connection_observer, connection_observer._result))
+                if connection_observer.done():
+                    if feed_wakeup is not None:
+                        self._wakeup_feeder(feed_wakeup)  # let feed() finish now
+                    if not connection_observer.cancelled():
+                        if connection_observer._exception:
+                            self.logger.debug("{} raised: {!r}".format(connection_observer,
+                                                                      connection_observer._exception))
+                        else:
+                            self.logger.debug("{} returned: {}".format(connection_observer,
+                                                                      connection_observer._result))
 
         moler_conn = connection_observer.connection
         self.logger.debug("subscribing for data {}".format(connection_observer))
         moler_conn.subscribe(observer=secure_data_received,
                              connection_closed_handler=connection_observer.connection_closed_handler)
-        if connection_observer.is_command():
+        if send_command and connection_observer.is_command():
             connection_observer.send_command()
         return secure_data_received  # to know what to unsubscribe
 
-    async def feed(self, connection_observer, subscribed_data_receiver, observer_lock):
+    async def feed(self, connection_observer, subscribed_data_receiver, observer_lock, feed_wakeup=None):
         """
         Feeds connection_observer by transferring data from connection and passing it to connection_observer.
         Should be called from background-processing of connection observer.
@@ -578,13 +599,20 @@ class AsyncioRunner(ConnectionObserverRunner):
         self.logger.debug("{} started, {}".format(connection_observer, msg))
         connection_observer._log(logging.INFO, "{} started, {}".format(connection_observer.get_long_desc(), msg))
 
+        if feed_wakeup is None:
+            feed_wakeup = asyncio.Event()
+            self._feed_wakeups[feed_wakeup] = asyncio.get_event_loop()
         if not subscribed_data_receiver:
-            subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
+            subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock, feed_wakeup,
+                                                           send_command=False)
+            if connection_observer.is_command():
+                # we are inside event loop - sending via connection may block, so it is done by thread of small pool
+                await asyncio.get_event_loop().run_in_executor(self._get_blocking_io_executor(),
+                                                               connection_observer.send_command)
 
         await asyncio.sleep(0.005)  # give control back before we start processing
         start_time = connection_observer.life_status.start_time
 
-        moler_conn = connection_observer.connection
         try:
             while True:
                 if connection_observer.done():
@@ -603,7 +631,9 @@ class AsyncioRunner(ConnectionObserverRunner):
                 if self._in_shutdown:
                     self.logger.debug("shutdown so cancelling {}".format(connection_observer))
                     connection_observer.cancel()
-                await asyncio.sleep(0.005)  # give moler_conn a chance to feed observer
+                    continue
+                # sleep till something to check: observer done, timeout or shutdown (no busy polling)
+                await self._wait_for_feed_wakeup(connection_observer, feed_wakeup, start_time)
             #
             # main purpose of feed() is to progress observer-life by time
             #             firing timeout should do: observer.set_exception(Timeout)
@@ -626,9 +656,10 @@ class AsyncioRunner(ConnectionObserverRunner):
             raise  # need to reraise to inform "I agree for cancellation"
 
         finally:
+            self._feed_wakeups.pop(feed_wakeup, None)
             self.logger.debug("unsubscribing {}".format(connection_observer))
-            moler_conn.unsubscribe(observer=subscribed_data_receiver,
-                                   connection_closed_handler=connection_observer.connection_closed_handler)
+            connection_observer.connection.unsubscribe(observer=subscribed_data_receiver,
+                                                       connection_closed_handler=connection_observer.connection_closed_handler)
             # feed_done.set()
 
             remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
@@ -637,8 +668,42 @@ class AsyncioRunner(ConnectionObserverRunner):
             self.logger.debug("{} finished, {}".format(connection_observer, msg))
         return None
 
+    async def _wait_for_feed_wakeup(self, connection_observer, feed_wakeup, start_time):
+        """
+        Sleep till feed_wakeup is set or time of next check of connection_observer comes.
+
+        :param connection_observer: ConnectionObserver object fed by feed().
+        :param feed_wakeup: asyncio.Event set when feed() should check connection_observer immediately.
+        :param start_time: time from which timeout of connection_observer is counted in feed().
+        :return: None
+        """
+        wait_time = self._max_feed_wait  # observer may become done without runner knowing (like user cancel())
+        if connection_observer.timeout is not None:
+            wait_time = min(wait_time, start_time + connection_observer.timeout - time.time())
+        if wait_time > 0.0:
+            try:
+                await asyncio.wait_for(feed_wakeup.wait(), timeout=wait_time)
+            except asyncio.TimeoutError:
+                pass
+        feed_wakeup.clear()
+
+    def _wakeup_feeder(self, feed_wakeup):
+        event_loop = self._feed_wakeups.get(feed_wakeup)
+        if (event_loop is not None) and (not event_loop.is_closed()):
+            event_loop.call_soon_threadsafe(feed_wakeup.set)  # may be called from connection's thread
+
+    def _wakeup_feeders(self):
+        for feed_wakeup in list(self._feed_wakeups):
+            self._wakeup_feeder(feed_wakeup)
+
     def timeout_change(self, timedelta):
-        pass
+        """
+        Wake up running feed() coroutines so that they recalculate time remaining till timeout of their observers.
+
+        :param timedelta: delta timeout in float seconds
+        :return: None
+        """
+        self._wakeup_feeders()
 
 
 class AsyncioEventThreadsafe(asyncio.Event):
@@ -799,11 +864,7 @@ class AsyncioInThreadRunner(AsyncioRunner):
         :return: iterator
         """
         self.logger.debug("returning iterator for {}".format(connection_observer))
-        while not connection_observer_future.done():
-            yield None
-        # return result_for_runners(connection_observer)  # May raise too.   # Python > 3.3
-        res = result_for_runners(connection_observer)
-        raise StopIteration(res)  # Python 2 compatibility
+        return FutureResultIterator(connection_observer, connection_observer_future)
 
 
 def cleanup_remaining_tasks(loop, logger):
@@ -544,7 +544,9 @@ class MolerMainMultilineWithDirectionFormatter(MultilineWithDirectionFormatter):
         if hasattr(record, 'moler_error'):
             record.levelname = "MOLER_ERROR"
 
-        record.msg = u"{:<20}|{}".format(record.log_name, record.msg)
+        # prefix already formatted message - log_name may contain '%' and can't become part of %-style template
+        record.msg = u"{:<20}|{}".format(record.log_name, record.getMessage())
+        record.args = None
 
         return super(MolerMainMultilineWithDirectionFormatter, self).format(record)
 
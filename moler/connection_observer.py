@@ -92,6 +92,7 @@ class ConnectionObserver(object):
         self.life_status.is_done = value
         if value:
             CommandScheduler.dequeue_running_on_connection(connection_observer=self)
+            self.runner.observer_change(self)
 
     @property
     def _is_cancelled(self):
@@ -119,6 +120,7 @@ class ConnectionObserver(object):
         self._log(logging.DEBUG, "Setting {} timeout to {} [sec]".format(ConnectionObserver.__base_str(self), value),
                   levels_to_go_up=2)
         self.life_status.timeout = value
+        self.runner.observer_change(self)
 
     @property
     def start_time(self):
@@ -11,9 +11,7 @@ __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com, michal.erns
 import abc
 import functools
 import importlib
-import inspect
 import logging
-import pkgutil
 import re
 import time
 import traceback
@@ -27,7 +25,7 @@ from moler.device.state_machine import StateMachine
 from moler.exceptions import CommandWrongState, DeviceFailure, EventWrongState, DeviceChangeStateFailure
 from moler.helpers import copy_dict, update_dict
 from moler.helpers import copy_list
-from moler.instance_loader import create_instance_from_class_fullname
+from moler.instance_loader import create_class_instance, load_class_from_class_fullname
 from moler.device.abstract_device import AbstractDevice
 try:
     import queue
@@ -43,6 +41,12 @@ class TextualDevice(AbstractDevice):
     not_connected = "NOT_CONNECTED"
     connection_hops = "CONNECTION_HOPS"
 
+    # class full name (like 'moler.cmd.unix.ls.Ls') -> class object, shared by all devices
+    _observer_classes = dict()
+    # package name (like 'moler.cmd.unix') -> dict of observer names with class full names, shared by all devices
+    _observers_in_packages = dict()
+    _observers_in_packages_lock = threading.Lock()
+
     def __init__(self, sm_params=None, name=None, io_connection=None, io_type=None, variant=None,
                  io_constructor_kwargs=None, initial_state=None, lazy_cmds_events=False):
         """
@@ -69,7 +73,9 @@ class TextualDevice(AbstractDevice):
         io_constructor_kwargs = copy_dict(io_constructor_kwargs, deep_copy=True)
         self.initial_state = initial_state if initial_state is not None else "NOT_CONNECTED"
         self.states = [TextualDevice.not_connected]
+        self._states_set = set(self.states)  # for fast membership check, content the same as in self.states
         self.goto_states_triggers = []
+        self._goto_state_triggers = dict()  # key is state, value is name of trigger (SM method) to enter this state
         self._name = name
         self.device_data_logger = None
         self.timeout_keep_state = 10  # Timeout for background goto state after unexpected state change.
@@ -82,6 +88,7 @@ class TextualDevice(AbstractDevice):
                                queued=True)
 
         self._state_hops = dict()
+        self._next_state_hops = dict()  # key is tuple (source state, dest state), value is next state on the way
         self._state_prompts = dict()
         self._state_prompts_lock = threading.Lock()
         self._reverse_state_prompts_dict = dict()
@@ -101,6 +108,7 @@ class TextualDevice(AbstractDevice):
 
         self._prepare_transitions()
         self._prepare_state_hops()
+        self._prepare_next_state_hops()
         self._configure_state_machine(sm_params)
         self._prepare_newline_chars()
 
@@ -110,6 +118,7 @@ class TextualDevice(AbstractDevice):
 
         self._cmdnames_available_in_state = dict()
         self._eventnames_available_in_state = dict()
+        self._packages_for_state = dict()  # key is tuple (state, observer type), value is list of packages
         self._default_prompt = re.compile(r'^[^<]*[\$|%|#|>|~]\s*$')
         self._neighbour_devices = None
         self._established = False
@@ -246,6 +255,17 @@ class TextualDevice(AbstractDevice):
     def _prepare_state_hops(self):
         pass
 
+    def _prepare_next_state_hops(self):
+        """
+        Flatten self._state_hops ({source: {dest: next}}) into dict with (source, dest) keys - one lookup per hop.
+
+        :return: None
+        """
+        self._next_state_hops = dict()
+        for source_state, hops in self._state_hops.items():
+            for dest_state, next_state in hops.items():
+                self._next_state_hops[(source_state, dest_state)] = next_state
+
     @classmethod
     def from_named_connection(cls, connection_name):
         io_conn = get_connection(name=connection_name)
@@ -342,25 +362,39 @@ class TextualDevice(AbstractDevice):
         if not self._public_name:
             self._public_name = value
 
-    def _log(self, level, msg, extra=None):
+    def _log(self, level, msg, *args, **kwargs):
+        """
+        Log message into device loggers.
+
+        :param level: log level.
+        :param msg: message, may contain %-style placeholders for args (formatted only when record is emitted).
+        :param args: arguments of message.
+        :param kwargs: may contain only 'extra' - dict passed as extra into logger.
+        :return: None
+        """
+        unexpected_params = set(kwargs) - {'extra'}
+        if unexpected_params:
+            raise TypeError("_log() got unexpected keyword arguments: {}".format(sorted(unexpected_params)))
         if self.logger:
             extra_params = {
                 'log_name': self.name
             }
 
+            extra = kwargs.get('extra')
             if extra:
                 extra_params.update(extra)
 
-            self.logger.log(level, msg, extra=extra_params)
+            self.logger.log(level, msg, *args, extra=extra_params)
 
-        self.device_data_logger.log(level, msg)
+        self.device_data_logger.log(level, msg, *args)
 
     def _set_state(self, state):
         if self.current_state != state:
             self.SM.set_state(state=state)
-        if self._kept_state is not None and self.current_state != self._kept_state:
-            state = self._kept_state
-            self._recover_state(state=state)
+        # state set above, no need to read it again from state machine
+        kept_state = self._kept_state
+        if kept_state is not None and state != kept_state:
+            self._recover_state(state=kept_state)
 
     def goto_state(self, state, timeout=-1, rerun=0, send_enter_after_changed_state=False,
                    log_stacktrace_on_fail=True, keep_state=False):
@@ -445,7 +479,7 @@ class TextualDevice(AbstractDevice):
             if keep_state:
                 self._kept_state = dest_state
             return
-        self._log(logging.DEBUG, "Go to state '%s' from '%s'" % (dest_state, self.current_state))
+        self._log(logging.DEBUG, "Go to state '%s' from '%s'", dest_state, self.current_state)
 
         is_dest_state = False
         is_timeout = False
@@ -453,8 +487,9 @@ class TextualDevice(AbstractDevice):
         next_stage_timeout = timeout
 
         while (not is_dest_state) and (not is_timeout):
-            next_state = self._get_next_state(dest_state)
-            if self.current_state != dest_state:
+            current_state = self.current_state
+            next_state = self._get_next_state(dest_state, current_state=current_state)
+            if current_state != dest_state:
                 self._trigger_change_state(next_state=next_state, timeout=next_stage_timeout, rerun=rerun,
                                            send_enter_after_changed_state=send_enter_after_changed_state,
                                            log_stacktrace_on_fail=log_stacktrace_on_fail)
@@ -470,11 +505,10 @@ class TextualDevice(AbstractDevice):
             self._kept_state = dest_state
         self._warning_was_sent = False
 
-    def _get_next_state(self, dest_state):
-        next_state = None
-        if self.current_state in self._state_hops.keys():
-            if dest_state in self._state_hops[self.current_state].keys():
-                next_state = self._state_hops[self.current_state][dest_state]
+    def _get_next_state(self, dest_state, current_state=None):
+        if current_state is None:
+            current_state = self.current_state
+        next_state = self._next_state_hops.get((current_state, dest_state))
 
         if not next_state:  # direct transition without hops
             next_state = dest_state
@@ -483,14 +517,13 @@ class TextualDevice(AbstractDevice):
 
     def _trigger_change_state(self, next_state, timeout, rerun, send_enter_after_changed_state,
                               log_stacktrace_on_fail=True):
-        self._log(logging.DEBUG, "'{}'. Changing state from '{}' into '{}'.".format(self.name, self.current_state,
-                                                                                    next_state))
+        self._log(logging.DEBUG, "'%s'. Changing state from '%s' into '%s'.", self.name, self.current_state, next_state)
         change_state_method = None
         # all state triggers used by SM are methods with names starting from "GOTO_"
         # for e.g. GOTO_REMOTE, GOTO_CONNECTED
-        for goto_method in self.goto_states_triggers:
-            if "GOTO_{}".format(next_state) == goto_method:
-                change_state_method = getattr(self, goto_method)
+        goto_method = self._goto_state_triggers.get(next_state)
+        if goto_method:
+            change_state_method = getattr(self, goto_method)
 
         if change_state_method:
             self._trigger_change_state_loop(rerun=rerun, next_state=next_state, change_state_method=change_state_method,
@@ -524,15 +557,15 @@ class TextualDevice(AbstractDevice):
                     raise exc
                 else:
                     retrying += 1
-                    self._log(logging.DEBUG, "Cannot change state into '{}'. "
-                                             "Retrying '{}' of '{}' times.".format(next_state, retrying, rerun))
+                    self._log(logging.DEBUG, "Cannot change state into '%s'. Retrying '%s' of '%s' times.",
+                              next_state, retrying, rerun)
                     if send_enter_after_changed_state:
                         self._send_enter_after_changed_state()
         if self.current_state == next_state:
             self.io_connection.moler_connection.change_newline_seq(self._get_newline(state=next_state))
             if send_enter_after_changed_state:
                 self._send_enter_after_changed_state()
-            self._log(logging.DEBUG, "{}: Successfully enter state '{}'".format(self.name, next_state))
+            self._log(logging.DEBUG, "%s: Successfully enter state '%s'", self.name, next_state)
 
     def on_connection_made(self, connection):
         self._set_state(TextualDevice.connected)
@@ -558,6 +591,23 @@ class TextualDevice(AbstractDevice):
         return self.states
 
     def _load_cmds_from_package(self, package_name):
+        """
+        Return observers available in package. Package is scanned only once, next calls (from any device) return
+        copy of stored result.
+
+        :param package_name: name of package (or module) like 'moler.cmd.unix'
+        :return: dict with observer names as keys and class full names as values
+        """
+        with TextualDevice._observers_in_packages_lock:
+            available_cmds = TextualDevice._observers_in_packages.get(package_name)
+            if available_cmds is None:
+                available_cmds = self._scan_package_for_cmds(package_name=package_name)
+                TextualDevice._observers_in_packages[package_name] = available_cmds
+        return copy_dict(available_cmds)
+
+    def _scan_package_for_cmds(self, package_name):
+        import pkgutil  # needed only once per package, see _load_cmds_from_package
+
         available_cmds = dict()
         basic_module = importlib.import_module(package_name)
         try:
@@ -577,9 +627,9 @@ class TextualDevice(AbstractDevice):
         available_cmds = dict()
 
         module = importlib.import_module(module_name)
-        for (cmd_class_name, cmd_module_name) in inspect.getmembers(module, inspect.isclass):
-            if cmd_module_name.__module__ == module_name:
-                cmd_class_obj = getattr(module, cmd_class_name)
+        # vars() instead of inspect.getmembers() - no sorting and no getattr() for every name of module
+        for (cmd_class_name, cmd_class_obj) in list(vars(module).items()):
+            if isinstance(cmd_class_obj, type) and cmd_class_obj.__module__ == module_name:
                 if issubclass(cmd_class_obj, ConnectionObserver):  # module may contain other classes (f.ex. exceptions)
                     # like:  IpAddr --> ip_addr
                     cmd_name = cmd_class_obj.observer_name
@@ -596,16 +646,18 @@ class TextualDevice(AbstractDevice):
         if not for_state:
             for_state = self.current_state
         if observer_type == TextualDevice.cmds:
+            if self._cmdnames_available_in_state.get(for_state) is None:
+                self._load_cmdnames_for_state(state=for_state)
             available_observer_names = self._cmdnames_available_in_state[for_state]
         elif observer_type == TextualDevice.events:
+            if self._eventnames_available_in_state.get(for_state) is None:
+                self._load_eventnames_for_state(state=for_state)
             available_observer_names = self._eventnames_available_in_state[for_state]
 
         if observer_name in available_observer_names:
             observer_params = dict(kwargs, connection=self.io_connection.moler_connection)
-            observer = create_instance_from_class_fullname(
-                class_fullname=available_observer_names[observer_name],
-                constructor_parameters=observer_params
-            )
+            observer_class = self._get_observer_class(class_fullname=available_observer_names[observer_name])
+            observer = create_class_instance(class_object=observer_class, constructor_params=observer_params)
             return observer
 
         exc = DeviceFailure(
@@ -616,12 +668,24 @@ class TextualDevice(AbstractDevice):
         self._log(logging.ERROR, exc)
         raise exc
 
+    @classmethod
+    def _get_observer_class(cls, class_fullname):
+        """
+        Return class object of observer. Once loaded class is cached so next calls don't import it again.
+
+        :param class_fullname: full name of class in dotted notation like 'moler.cmd.unix.ls.Ls'
+        :return: class object
+        """
+        observer_class = TextualDevice._observer_classes.get(class_fullname)
+        if observer_class is None:
+            observer_class = load_class_from_class_fullname(class_fullname)
+            TextualDevice._observer_classes[class_fullname] = observer_class
+        return observer_class
+
     def _create_cmd_instance(self, cmd_name, for_state, **kwargs):
         """
         CAUTION: it checks if cmd may be created in current_state of device
         """
-        if self._cmdnames_available_in_state[for_state] is None:
-            self._load_cmdnames_for_state(state=for_state)
         return self._get_observer_in_state(observer_name=cmd_name, observer_type=TextualDevice.cmds,
                                            for_state=for_state, **kwargs)
 
@@ -629,8 +693,6 @@ class TextualDevice(AbstractDevice):
         """
         CAUTION: it checks if event may be created in current_state of device
         """
-        if self._eventnames_available_in_state[for_state] is None:
-            self._load_eventnames_for_state(state=for_state)
         return self._get_observer_in_state(observer_name=event_name, observer_type=TextualDevice.events,
                                            for_state=for_state, **kwargs)
 
@@ -645,23 +707,32 @@ class TextualDevice(AbstractDevice):
             observer = self._create_event_instance(observer_name, for_state=for_state, **kwargs)
 
         if check_state:
-            original_fun = observer._validate_start
-            creation_state = for_state
-
-            @functools.wraps(observer._validate_start)
-            def validate_device_state_before_observer_start(*args, **kargs):
-                current_state = self.current_state
-                if current_state == creation_state:
-                    ret = original_fun(*args, **kargs)
-                    return ret
-                else:
-                    exc = observer_exception(observer, creation_state, current_state)
-                    self._log(logging.ERROR, exc)
-                    raise exc
-
-            observer._validate_start = validate_device_state_before_observer_start
+            # partial instead of decorated closure - no metadata copying by functools.wraps, no closure cells
+            observer._validate_start = functools.partial(self._validate_device_state_before_observer_start,
+                                                         observer, observer._validate_start, for_state,
+                                                         observer_exception)
         return observer
 
+    def _validate_device_state_before_observer_start(self, observer, original_fun, creation_state, observer_exception,
+                                                     *args, **kwargs):
+        """
+        Call original _validate_start of observer only if device is still in state where observer was created.
+
+        :param observer: command or event created by device
+        :param original_fun: original _validate_start method of observer
+        :param creation_state: state of device when observer was created
+        :param observer_exception: exception class (CommandWrongState or EventWrongState) raised on state mismatch
+        :param args: positional arguments of original_fun
+        :param kwargs: keyword arguments of original_fun
+        :return: result of original_fun
+        """
+        current_state = self.current_state
+        if current_state == creation_state:
+            return original_fun(*args, **kwargs)
+        exc = observer_exception(observer, creation_state, current_state)
+        self._log(logging.ERROR, exc)
+        raise exc
+
     def get_cmd(self, cmd_name, cmd_params=None, check_state=True, for_state=None):
         """
         Returns instance of command connected with the device.
@@ -729,11 +800,26 @@ class TextualDevice(AbstractDevice):
     def _collect_observer_for_state(self, observer_type, state):
         observer = dict()
 
-        for package_name in self._get_packages_for_state(state=state, observer=observer_type):
+        for package_name in self._get_cached_packages_for_state(state=state, observer_type=observer_type):
             observer.update(self._load_cmds_from_package(package_name))
 
         return observer
 
+    def _get_cached_packages_for_state(self, state, observer_type):
+        """
+        Returns list of packages for a given state. _get_packages_for_state is called only once for every pair of
+        state and observer type. Packages may depend on device configuration so they are cached per device.
+
+        :param state: state name
+        :param observer_type: type of return packages - Device.events or Device.cmds
+        :return: list of packages
+        """
+        key = (state, observer_type)
+        if key not in self._packages_for_state:
+            packages = self._get_packages_for_state(state=state, observer=observer_type)
+            self._packages_for_state[key] = copy_list(packages)
+        return self._packages_for_state[key]
+
     def _collect_cmds_for_state(self, state):
         cmds = self._collect_observer_for_state(observer_type=TextualDevice.cmds, state=state)
 
@@ -745,23 +831,25 @@ class TextualDevice(AbstractDevice):
         return events
 
     def _add_transitions(self, transitions):
+        all_transitions = list()
         for source_state in transitions.keys():
             for dest_state in transitions[source_state].keys():
                 self._update_SM_states(dest_state)
 
-                single_transition = [
+                all_transitions.append(
                     {'trigger': self.build_trigger_to_state(dest_state),
                      'source': source_state,
                      'dest': dest_state,
-                     'prepare': transitions[source_state][dest_state]["action"]},
-                ]
+                     'prepare': transitions[source_state][dest_state]["action"]}
+                )
 
-                self.SM.add_transitions(single_transition)
+        self.SM.add_transitions(all_transitions)
 
     def _update_SM_states(self, state):
-        if state not in self.states:
+        if state not in self._states_set:
             self.SM.add_state(state)
             self.states.append(state)
+            self._states_set.add(state)
 
     def _open_connection(self, source_state, dest_state, timeout):
         self.io_connection.open()
@@ -828,8 +916,9 @@ class TextualDevice(AbstractDevice):
 
     def build_trigger_to_state(self, state):
         trigger = "GOTO_{}".format(state)
-        if trigger not in self.goto_states_triggers:
+        if state not in self._goto_state_triggers:
             self.goto_states_triggers += [trigger]
+            self._goto_state_triggers[state] = trigger
         return trigger
 
     def get_prompt(self):
@@ -901,7 +990,7 @@ class TextualDevice(AbstractDevice):
             cmd_enter = Enter(connection=self.io_connection.moler_connection)
             cmd_enter()
         except Exception as ex:
-            self._log(logging.DEBUG, "Cannot execute command 'enter' properly: {}".format(ex))
+            self._log(logging.DEBUG, "Cannot execute command 'enter' properly: %s", ex)
             pass
 
     def _get_newline(self, state=None):
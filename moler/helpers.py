@@ -11,6 +11,7 @@ import copy
 import datetime
 import importlib
 import logging
+import os
 import re
 from functools import wraps
 from types import FunctionType, MethodType
@@ -384,3 +385,19 @@ def all_chars_to_hex(source):
     for char in source:
         output += "\\x{:02x}".format(ord(char))
     return output
+
+
+def effective_cpu_count():
+    """
+    Return number of CPUs usable by this process.
+    Inside container (cgroups, taskset) it may be less than number of CPUs of host machine.
+    :return: number of usable CPUs (at least 1).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):  # not available on Windows, MacOS and Python 2; not supported by platform
+        import multiprocessing
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            return 1
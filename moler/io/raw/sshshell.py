@@ -18,7 +18,6 @@ __email__ = 'grzegorz.latuszek@nokia.com'
 import socket
 import threading
 import contextlib
-import paramiko
 import time
 import getpass
 import logging
@@ -43,9 +42,12 @@ class SshShell(object):
     like asking for login or password.
     """
     _channels_of_transport = {}  # key is instance_id(transport), value is list of channel IDs
+    _shared_ssh_clients = {}  # key is (host, port, username), value is ssh client with open transport
+    _shared_ssh_clients_lock = threading.Lock()  # guards only bookkeeping, never held during network exchange
+    _channels_being_opened = {}  # key is instance_id(transport), value is number of shell channels being opened
 
     def __init__(self, host, port=22, username=None, login=None, password=None, receive_buffer_size=64 * 4096,
-                 logger=None, existing_client=None):
+                 logger=None, existing_client=None, share_transport=False):
         """
         Initialization of SshShell connection.
 
@@ -57,6 +59,8 @@ class SshShell(object):
         :param receive_buffer_size:
         :param logger: logger to use (None means no logging)
         :param existing_client: (internal use) for reusing ssh transport of existing sshshell
+        :param share_transport: if True then open() reuses ssh transport of other open sshshell created with
+                                share_transport=True towards same host/port/username (no new ssh login)
         """
         super(SshShell, self).__init__()
         self.host = host
@@ -68,9 +72,10 @@ class SshShell(object):
         self.password = password
         self.receive_buffer_size = receive_buffer_size
         self.logger = logger
+        self._address = 'ssh://{}@{}:{}'.format(self.username, self.host, self.port)
 
-        self.ssh_client = existing_client if existing_client else paramiko.SSHClient()
-        self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self._ssh_client = existing_client  # created on first use - paramiko import is costly
+        self.share_transport = share_transport
         self._shell_channel = None  # MOST IMPORTANT
         self.timeout = None
         self.await_ready_tick_resolution = 0.01
@@ -92,18 +97,33 @@ class SshShell(object):
         new_sshshell = cls(host=sshshell.host, port=sshshell.port,
                            username=sshshell.username, password=sshshell.password,
                            receive_buffer_size=sshshell.receive_buffer_size,
-                           logger=logger, existing_client=sshshell.ssh_client)
+                           logger=logger, existing_client=sshshell.ssh_client,
+                           share_transport=sshshell.share_transport)
         return new_sshshell
 
+    @property
+    def ssh_client(self):
+        """Paramiko's SSHClient of connection (may be shared with other connections reusing its transport)."""
+        if self._ssh_client is None:
+            import paramiko
+
+            self._ssh_client = paramiko.SSHClient()
+            self._ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        return self._ssh_client
+
     @property
     def _ssh_transport(self):
-        return self.ssh_client.get_transport()
+        if self._ssh_client is None:
+            return None
+        return self._ssh_client.get_transport()
 
     def _settimeout(self, timeout):
-        if (self.timeout is None) or (timeout != self.timeout):
-            if self._shell_channel:
-                self._shell_channel.settimeout(timeout)
-                self.timeout = timeout
+        if (timeout == self.timeout) and (timeout is not None):
+            return  # most common case: receive() called repeatedly with same timeout
+        shell_channel = self._shell_channel
+        if shell_channel:
+            shell_channel.settimeout(timeout)
+            self.timeout = timeout
 
     def open(self):
         """
@@ -117,26 +137,111 @@ class SshShell(object):
         """
         if self._shell_channel is None:
             self._debug('connecting to {}'.format(self))
+            self._open_shell_channel()
+        self._info('connection {} is open'.format(self))
+        return contextlib.closing(self)
 
+    def _open_shell_channel(self):
+        shared_key = (self.host, self.port, self.username)
+        transport = None
+        if self.share_transport:
+            with SshShell._shared_ssh_clients_lock:
+                transport = self._reserve_shared_transport(shared_key)
+        reserved = transport is not None
+        if transport is None:
             transport = self.ssh_client.get_transport()
-            if transport is None:
-                self.ssh_client.connect(self.host, username=self.username, password=self.password)
-                transport = self.ssh_client.get_transport()
-                action = "established"
-            else:
-                action = "reusing"
-            transport_info = ['local version = {}'.format(transport.local_version),
-                              'remote version = {}'.format(transport.remote_version),
-                              'using socket = {}'.format(transport.sock)]
-            self._debug('  {} ssh transport to {}:{} |{}\n    {}'.format(action, self.host, self.port, transport,
-                                                                         "\n    ".join(transport_info)))
-            self._shell_channel = self.ssh_client.invoke_shell()  # newly created channel will be connected to Pty
+        if transport is None:
+            # ssh login may take seconds - it is done without lock, other connections are not blocked
+            self.ssh_client.connect(self.host, username=self.username, password=self.password)
+            transport = self.ssh_client.get_transport()
+            action = "established"
+            if self.share_transport:
+                with SshShell._shared_ssh_clients_lock:
+                    self._register_shared_ssh_client(shared_key)
+                reserved = True
+        else:
+            action = "reusing"
+        if not reserved:
+            self._invoke_shell_channel(transport, action)
             self._remember_channel_of_transport(self._shell_channel)
-            self._debug('  established shell ssh to {}:{} [channel {}] |{}'.format(self.host, self.port,
-                                                                                   self._shell_channel.get_id(),
-                                                                                   self._shell_channel))
-        self._info('connection {} is open'.format(self))
-        return contextlib.closing(self)
+            return
+        try:
+            self._invoke_shell_channel(transport, action)
+        finally:
+            with SshShell._shared_ssh_clients_lock:
+                transport_unused = self._release_reserved_transport(transport)
+            if transport_unused:
+                self._close_transport()
+
+    def _reserve_shared_transport(self, shared_key):
+        """
+        Find active transport shared by other connections and reserve it for channel being opened.
+
+        Must be called under _shared_ssh_clients_lock.
+
+        :param shared_key: (host, port, username) of shared ssh client
+        :return: reserved transport or None if there is no active shared transport
+        """
+        if self._ssh_client is None:
+            shared_client = SshShell._shared_ssh_clients.get(shared_key)
+            if shared_client is not None:
+                shared_transport = shared_client.get_transport()
+                if (shared_transport is not None) and shared_transport.is_active():
+                    self._ssh_client = shared_client
+        transport = self._ssh_transport
+        if (transport is not None) and transport.is_active():
+            self._remember_channel_being_opened(transport)
+            return transport
+        return None
+
+    def _register_shared_ssh_client(self, shared_key):
+        """
+        Make our freshly connected ssh client available for other sharing connections and reserve its transport.
+
+        Must be called under _shared_ssh_clients_lock.
+
+        :param shared_key: (host, port, username) of shared ssh client
+        :return: None
+        """
+        shared_client = SshShell._shared_ssh_clients.get(shared_key)
+        if (shared_client is None) or (shared_client.get_transport() is None) or \
+                (not shared_client.get_transport().is_active()):
+            SshShell._shared_ssh_clients[shared_key] = self.ssh_client
+        self._remember_channel_being_opened(self._ssh_transport)
+
+    def _release_reserved_transport(self, transport):
+        """
+        Drop reservation of transport made for channel being opened.
+
+        Must be called under _shared_ssh_clients_lock.
+
+        :param transport: transport reserved by _reserve_shared_transport() or _register_shared_ssh_client()
+        :return: True if opening channel failed and transport is left unused (should be closed)
+        """
+        self._forget_channel_being_opened(transport)
+        if self._shell_channel is None:  # opening failed
+            return self._forget_transport_if_unused()
+        self._remember_channel_of_transport(self._shell_channel)
+        return False
+
+    def _invoke_shell_channel(self, transport, action):
+        transport_info = ['local version = {}'.format(transport.local_version),
+                          'remote version = {}'.format(transport.remote_version),
+                          'using socket = {}'.format(transport.sock)]
+        self._debug('  {} ssh transport to {}:{} |{}\n    {}'.format(action, self.host, self.port, transport,
+                                                                     "\n    ".join(transport_info)),
+                    levels_to_go_up=4)
+        self._shell_channel = self.ssh_client.invoke_shell()  # newly created channel will be connected to Pty
+        self._debug('  established shell ssh to {}:{} [channel {}] |{}'.format(self.host, self.port,
+                                                                               self._shell_channel.get_id(),
+                                                                               self._shell_channel),
+                    levels_to_go_up=4)
+
+    @classmethod
+    def _forget_shared_ssh_client(cls, ssh_client):
+        for shared_key, shared_client in list(cls._shared_ssh_clients.items()):
+            if shared_client is ssh_client:
+                del cls._shared_ssh_clients[shared_key]
 
     @classmethod
     def _remember_channel_of_transport(cls, channel):
@@ -156,12 +261,26 @@ class SshShell(object):
             if len(cls._channels_of_transport[transport_id]) == 0:
                 del cls._channels_of_transport[transport_id]
 
+    @classmethod
+    def _remember_channel_being_opened(cls, transport):
+        transport_id = instance_id(transport)
+        cls._channels_being_opened[transport_id] = cls._channels_being_opened.get(transport_id, 0) + 1
+
+    @classmethod
+    def _forget_channel_being_opened(cls, transport):
+        transport_id = instance_id(transport)
+        if cls._channels_being_opened.get(transport_id, 0) > 1:
+            cls._channels_being_opened[transport_id] -= 1
+        else:
+            cls._channels_being_opened.pop(transport_id, None)
+
     @classmethod
     def _num_channels_of_transport(cls, transport):
         transport_id = instance_id(transport)
+        num_channels = cls._channels_being_opened.get(transport_id, 0)
         if transport_id in cls._channels_of_transport:
-            return len(cls._channels_of_transport[transport_id])
-        return 0
+            num_channels += len(cls._channels_of_transport[transport_id])
+        return num_channels
 
     def close(self):
         """
@@ -178,20 +297,36 @@ class SshShell(object):
         which_channel = ""
         if self._shell_channel is not None:
             which_channel = "[channel {}] ".format(self._shell_channel.get_id())
+            # no need to wait for Paramiko threads here - channel.close() sets channel.closed before returning.
+            # Only peer's CLOSE reply is processed later but code below doesn't depend on it
+            # (channels of transport are counted by ourselves in _channels_of_transport)
             self._shell_channel.close()
-            time.sleep(0.05)  # give Paramiko threads time to catch correct value of status variables
             self._debug('  closed shell ssh to {}:{} {}|{}'.format(self.host, self.port,
                                                                    which_channel,
                                                                    self._shell_channel))
             self._forget_channel_of_transport(self._shell_channel)
             self._shell_channel = None
-        transport = self.ssh_client.get_transport()
-        if transport is not None:
-            if self._num_channels_of_transport(transport) == 0:
-                self._debug('  closing ssh transport to {}:{} |{}'.format(self.host, self.port, transport))
-                self.ssh_client.close()
+        if self.share_transport:
+            with SshShell._shared_ssh_clients_lock:  # no other sshshell may start using transport meanwhile
+                transport_unused = self._forget_transport_if_unused()
+        else:
+            transport_unused = self._forget_transport_if_unused()
+        if transport_unused:  # forgotten transport is not visible to others - may be closed without lock
+            self._close_transport()
         self._info('connection {} {}is closed'.format(self, which_channel))
 
+    def _forget_transport_if_unused(self):
+        transport = self._ssh_transport
+        if (transport is not None) and (self._num_channels_of_transport(transport) == 0):
+            self._forget_shared_ssh_client(self.ssh_client)
+            return True
+        return False
+
+    def _close_transport(self):
+        self._debug('  closing ssh transport to {}:{} |{}'.format(self.host, self.port, self._ssh_transport),
+                    levels_to_go_up=3)
+        self.ssh_client.close()
+
     def __enter__(self):
         """While working as context manager connection should auto-open if it's not open yet."""
         self.open()
@@ -203,11 +338,8 @@ class SshShell(object):
 
     def __str__(self):
         if self._shell_channel:
-            shell_channel_id = self._shell_channel.get_id()
-            address = 'ssh://{}@{}:{} [channel {}]'.format(self.username, self.host, self.port, shell_channel_id)
-        else:
-            address = 'ssh://{}@{}:{}'.format(self.username, self.host, self.port)
-        return address
+            return '{} [channel {}]'.format(self._address, self._shell_channel.get_id())
+        return self._address
 
     def send(self, data, timeout=1):
         """
@@ -266,13 +398,14 @@ class SshShell(object):
 
     def _recv(self):
         """Receive data."""
-        if not self._shell_channel:
+        shell_channel = self._shell_channel
+        if not shell_channel:
             raise RemoteEndpointNotConnected()
         try:
             # ensure we will never block in channel.recv()
-            if not self._shell_channel.gettimeout():
-                self._shell_channel.settimeout(self.await_ready_tick_resolution)
-            data = self._shell_channel.recv(self.receive_buffer_size)
+            if not shell_channel.gettimeout():
+                shell_channel.settimeout(self.await_ready_tick_resolution)
+            data = shell_channel.recv(self.receive_buffer_size)
         except socket.timeout:
             # don't want to show class name - just ssh address
             # want same output from any implementation of SshShell-connection
@@ -325,7 +458,8 @@ class ThreadedSshShell(IOConnection):
                  receive_buffer_size=64 * 4096,
                  name=None,
                  logger_name="",
-                 existing_client=None):
+                 existing_client=None,
+                 share_transport=False):
         """
         Initialization of SshShell-threaded connection.
 
@@ -339,6 +473,8 @@ class ThreadedSshShell(IOConnection):
         :param name: name assigned to connection
         :param logger_name: take that logger from logging
         :param existing_client: (internal use) for reusing ssh transport of existing sshshell
+        :param share_transport: if True then open() reuses ssh transport of other open sshshell created with
+                                share_transport=True towards same host/port/username (no new ssh login)
 
         Logger is retrieved by logging.getLogger(logger_name)
         If logger_name == "" - take default logger "<moler-connection-logger>.io"
@@ -350,7 +486,8 @@ class ThreadedSshShell(IOConnection):
         self.logger = self._select_logger(logger_name, self.name, moler_connection)
         self.sshshell = SshShell(host=host, port=port, username=username, login=login, password=password,
                                  receive_buffer_size=receive_buffer_size,
-                                 logger=self.logger, existing_client=existing_client)
+                                 logger=self.logger, existing_client=existing_client,
+                                 share_transport=share_transport)
         self.pulling_thread = None
         self.pulling_timeout = 0.1
         self._pulling_done = threading.Event()
@@ -375,7 +512,8 @@ class ThreadedSshShell(IOConnection):
         new_sshshell = cls(moler_connection=moler_connection, host=sshshell.host, port=sshshell.port,
                            username=sshshell.username, password=sshshell.password,
                            receive_buffer_size=sshshell.receive_buffer_size, name=name,
-                           logger_name=logger_name, existing_client=sshshell.ssh_client)
+                           logger_name=logger_name, existing_client=sshshell.ssh_client,
+                           share_transport=sshshell.share_transport)
         return new_sshshell
 
     @property
@@ -55,25 +55,54 @@ class ObserverThreadWrapper(object):
     def _loop_for_observer(self):
         """
         Loop to pass data (put by method feed) to observer.
+        All data already waiting in queue is taken at once and passed to observer chunk by chunk.
         :return: None
         """
         while self._request_end is False:
             try:
-                data, timestamp = self._queue.get(True, self._timeout_for_get_from_queue)
-                try:
-                    self.logger.log(level=TRACE, msg=r'notifying {}({!r})'.format(self._observer, repr(data)))
-                except ReferenceError:
-                    self._request_end = True  # self._observer is no more valid.
-                try:
-                    if self._observer_self:
-                        self._observer(self._observer_self, data, timestamp)
-                    else:
-                        self._observer(data, timestamp)
-                except ReferenceError:
-                    self._request_end = True  # self._observer is no more valid.
-                except Exception:
-                    self.logger.exception(msg=r'Exception inside: {}({!r})'.format(self._observer, repr(data)))
+                batch = [self._queue.get(True, self._timeout_for_get_from_queue)]
             except queue.Empty:
-                pass  # No incoming data within self._timeout_for_get_from_queue
+                continue  # No incoming data within self._timeout_for_get_from_queue
+            batch.extend(self._get_queued_data())
+            trace_enabled = self.logger.isEnabledFor(TRACE)
+            for data, timestamp in batch:
+                if self._request_end:
+                    break
+                self._notify_observer(data, timestamp, trace_enabled)
         self._observer = None
         self._observer_self = None
+
+    def _get_queued_data(self):
+        """
+        Take data waiting in queue without blocking.
+        :return: list of (data, recv_time) tuples.
+        """
+        queued = []
+        while True:
+            try:
+                queued.append(self._queue.get_nowait())
+            except queue.Empty:
+                return queued
+
+    def _notify_observer(self, data, timestamp, trace_enabled):
+        """
+        Pass one chunk of data to observer.
+        :param data: data to pass.
+        :param timestamp: time of data really read from connection.
+        :param trace_enabled: True if notification should be logged.
+        :return: None
+        """
+        if trace_enabled:
+            try:
+                self.logger.log(level=TRACE, msg=r'notifying {}({!r})'.format(self._observer, repr(data)))
+            except ReferenceError:
+                self._request_end = True  # self._observer is no more valid.
+        try:
+            if self._observer_self:
+                self._observer(self._observer_self, data, timestamp)
+            else:
+                self._observer(data, timestamp)
+        except ReferenceError:
+            self._request_end = True  # self._observer is no more valid.
+        except Exception:
+            self.logger.exception(msg=r'Exception inside: {}({!r})'.format(self._observer, repr(data)))
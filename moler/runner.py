@@ -12,6 +12,7 @@ __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com, michal.erns
 import atexit
 import concurrent.futures
 import logging
+import os
 import threading
 import time
 from abc import abstractmethod, ABCMeta
@@ -26,6 +27,8 @@ from moler.exceptions import MolerException
 from moler.exceptions import CommandFailure
 from moler.util.loghelper import log_into_logger
 
+_monotonic = getattr(time, "monotonic", time.time)  # Python 2 has no monotonic clock
+
 
 @add_metaclass(ABCMeta)
 class ConnectionObserverRunner(object):
@@ -80,6 +83,14 @@ class ConnectionObserverRunner(object):
         :return: None
         """
 
+    def observer_change(self, connection_observer):
+        """
+        Call this method to notify runner that observer has become done or its timeout has been changed
+        :param connection_observer: The one that has changed.
+        :return: None
+        """
+        pass
+
     def __enter__(self):
         return self
 
@@ -129,8 +140,73 @@ def result_for_runners(connection_observer):
     return connection_observer.result()
 
 
+class FutureResultIterator(object):
+    """
+    Iterator implementing awaitable protocol over future of connection-observer.
+
+    It is plain iterator (not generator) since generator can't raise StopIteration carrying result (PEP 479).
+    When iterated by asyncio Task it yields asyncio future woken by done-callback of awaited future
+    so that Task sleeps instead of being rescheduled in a loop.
+    """
+
+    def __init__(self, connection_observer, connection_observer_future):
+        """
+        :param connection_observer: The one we are awaiting for.
+        :param connection_observer_future: Future of connection-observer returned from submit().
+        """
+        self.connection_observer = connection_observer
+        self.connection_observer_future = connection_observer_future
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.connection_observer_future.done():
+            # return result_for_runners(connection_observer)  # May raise too.   # Python > 3.3
+            raise StopIteration(result_for_runners(self.connection_observer))
+        return self._get_waiter()
+
+    next = __next__  # Python 2 compatibility
+
+    def _get_waiter(self):
+        """
+        Prepare object to be yielded to iteration driver.
+
+        :return: asyncio future resolved when awaited future is done or None if not driven by asyncio loop.
+        """
+        try:
+            import asyncio
+        except ImportError:  # Python 2
+            return None
+        try:
+            if hasattr(asyncio, "get_running_loop"):  # Python 3.7+
+                loop = asyncio.get_running_loop()
+            else:
+                loop = asyncio.get_event_loop()
+                if not loop.is_running():
+                    return None
+        except RuntimeError:  # no running loop in this thread
+            return None
+        waiter = loop.create_future()
+
+        def _wakeup_waiter():
+            if not waiter.done():
+                waiter.set_result(None)
+
+        def _on_future_done(future):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wakeup_waiter)
+
+        self.connection_observer_future.add_done_callback(_on_future_done)
+        waiter._asyncio_future_blocking = True  # same as asyncio.Future.__iter__() does
+        return waiter
+
+
 class CancellableFuture(object):
-    def __init__(self, future, observer_lock, stop_running, is_done, stop_timeout=0.5):
+    __slots__ = ('_future', 'observer_lock', '_stop_running', '_stop_timeout', '_is_done', '_wakeup', '_cancelled',
+                 'running', 'add_done_callback', '_condition', '_waiters')
+
+    def __init__(self, future, observer_lock, stop_running, is_done, stop_timeout=0.5, wakeup=None):
         """
         Wrapper to allow cancelling already running concurrent.futures.Future
 
@@ -142,15 +218,28 @@ class CancellableFuture(object):
         :param stop_running: set externally to finish thread execution of function
         :param is_done: set when function finished running in thread
         :param stop_timeout: timeout to await is_done after setting stop_running
+        :param wakeup: event awaited by thread-running function, set together with stop_running (may be None)
         """
         self._future = future
         self.observer_lock = observer_lock  # against threads race write-access to observer
         self._stop_running = stop_running
         self._stop_timeout = stop_timeout
         self._is_done = is_done
+        self._wakeup = wakeup
+        self._cancelled = False  # embedded future can't be cancelled when running, so we remember it here
+        # most used API of embedded future bound directly - no __getattr__() call for each access
+        self.running = future.running
+        self.add_done_callback = future.add_done_callback
+        self._condition = future._condition  # used by concurrent.futures.wait()
+        self._waiters = future._waiters
+
+    @property
+    def _state(self):
+        """State of embedded future (used by concurrent.futures.wait())"""
+        return self._future._state
 
     def __getattr__(self, attr):
-        """Make it proxy to embedded future"""
+        """Make it proxy to embedded future (for remaining attributes)"""
         attribute = getattr(self._future, attr)
         return attribute
 
@@ -167,17 +256,36 @@ class CancellableFuture(object):
         """
         if self.running():
             self._stop(no_wait)
-            if no_wait:
-                return True
-            # after exiting threaded-function future.state == FINISHED
-            # we need to change it to PENDING to allow for correct cancel via concurrent.futures.Future
-            with self._condition:
-                self._future._state = concurrent.futures._base.PENDING
-
+            if not no_wait:
+                # threaded-function has exited so embedded future finishes without being cancelled
+                self._cancelled = True
+            return True
         return self._future.cancel()
 
+    def cancelled(self):
+        """Return True if future (running or not) was cancelled."""
+        return self._cancelled or self._future.cancelled()
+
+    def done(self):
+        """Return True if future was cancelled or finished running."""
+        return self._cancelled or self._future.done()
+
+    def result(self, timeout=None):
+        """Return result of embedded future, raise CancelledError if future was cancelled."""
+        if self._cancelled:
+            raise concurrent.futures.CancelledError()
+        return self._future.result(timeout=timeout)
+
+    def exception(self, timeout=None):
+        """Return exception of embedded future, raise CancelledError if future was cancelled."""
+        if self._cancelled:
+            raise concurrent.futures.CancelledError()
+        return self._future.exception(timeout=timeout)
+
     def _stop(self, no_wait=False):
         self._stop_running.set()  # force threaded-function to exit
+        if self._wakeup is not None:
+            self._wakeup.set()  # and don't let it sleep till its next check
         if no_wait:
             return
         if not self._is_done.wait(timeout=self._stop_timeout):
@@ -192,6 +300,9 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
     def __init__(self, executor=None):
         """Create instance of ThreadPoolExecutorRunner class"""
         self._tick = 0.005  # Tick for sleep or partial timeout
+        self._max_feed_wait = 1.0  # max. sleep of feed loop - safety net for observer changes not signalled to runner
+        self._feed_wakeups = {}  # id(observer): event of its feed loop - set to wake loop up
+        self._wait_for_wakeups = {}  # id(observer): event of wait_for() awaiting it - set to wake wait_for() up
         self._in_shutdown = False
         self._i_own_executor = False
         self._was_timeout_called = False
@@ -200,7 +311,8 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         self.logger.debug("created")
         atexit.register(self.shutdown)
         if executor is None:
-            max_workers = 1000  # max 1000 threads in pool
+            # each running observer occupies one thread in pool - by default max 1000 threads
+            max_workers = int(os.getenv('MOLER_MAX_WORKERS', 1000))
             try:  # concurrent.futures  v.3.2.0 introduced prefix we like :-)
                 self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ThrdPoolRunner')
             except TypeError as exc:
@@ -216,8 +328,13 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
     def shutdown(self):
         self.logger.debug("shutting down")
         self._in_shutdown = True  # will exit from feed() without stopping executor (since others may still use that executor)
+        self._wakeup_feed_loops()
         if self._i_own_executor:
-            self.executor.shutdown()  # also stop executor since only I use it
+            # also stop executor since only I use it; feeds not started yet will not start (Python >= 3.9)
+            try:
+                self.executor.shutdown(cancel_futures=True)
+            except TypeError:
+                self.executor.shutdown()
 
     def submit(self, connection_observer):
         """
@@ -254,11 +371,13 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
 
         stop_feeding = threading.Event()
         feed_done = threading.Event()
+        feed_wakeup = threading.Event()  # wakes feed loop when there is something to check
         observer_lock = threading.Lock()  # against threads race write-access to observer
-        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
+        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock, feed_wakeup)
+        self._feed_wakeups[id(connection_observer)] = feed_wakeup
         connection_observer_future = self.executor.submit(self.feed, connection_observer,
                                                           subscribed_data_receiver,
-                                                          stop_feeding, feed_done, observer_lock)
+                                                          stop_feeding, feed_done, observer_lock, feed_wakeup)
         if connection_observer_future.done():
             # most probably we have some exception during submit(); it should be stored inside future
             try:
@@ -278,7 +397,7 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         connection_observer_future.add_done_callback(finalizer)
 
         c_future = CancellableFuture(connection_observer_future, observer_lock,
-                                     stop_feeding, feed_done)
+                                     stop_feeding, feed_done, wakeup=feed_wakeup)
         connection_observer.life_status.last_feed_time = time.time()
         return c_future
 
@@ -356,32 +475,54 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                         self._cancel_submitted_future(connection_observer, future)
                         return True
             else:
-                while eol_remain_time > 0.0:
-                    done, not_done = wait([future], timeout=self._tick)
-                    if (future in done) or connection_observer.done():
-                        self._cancel_submitted_future(connection_observer, future)
-                        return True
-                    already_passed = time.time() - connection_observer.life_status.start_time
-                    eol_timeout = connection_observer.timeout + connection_observer.life_status.terminating_timeout
-                    eol_remain_time = eol_timeout - already_passed
-                    timeout = connection_observer.timeout
-                    remain_time = timeout - already_passed
-                    if remain_time <= 0.0:
-                        self._wait_for_time_out(connection_observer, connection_observer_future,
-                                                timeout=await_timeout)
-                        if not connection_observer.life_status.in_terminating:
-                            connection_observer.life_status.in_terminating = True
+                # feed loop finishes future as soon as observer is done (or timed out by feed loop);
+                # observer done outside of feed (set_result/cancel before feed started) wakes us via observer_change()
+                wakeup = threading.Event()
+                future.add_done_callback(lambda fut: wakeup.set())
+                self._wait_for_wakeups[id(connection_observer)] = wakeup
+                try:
+                    return self._await_future_till_eol(connection_observer, connection_observer_future, future,
+                                                       await_timeout, remain_time, eol_remain_time, wakeup)
+                finally:
+                    self._wait_for_wakeups.pop(id(connection_observer), None)
         else:
             self._wait_for_not_started_connection_observer_is_done(connection_observer=connection_observer)
         return False
 
+    def _await_future_till_eol(self, connection_observer, connection_observer_future, future, await_timeout,
+                               remain_time, eol_remain_time, wakeup):
+        # observer's start_time is wall-clock one; count further on monotonic clock (immune to clock jumps)
+        start_mono = _monotonic() - (time.time() - connection_observer.life_status.start_time)
+        while eol_remain_time > 0.0:
+            wait_time = remain_time if remain_time > 0.0 else eol_remain_time
+            # limited wait - safety net for changes of observer not signalled to runner
+            wakeup.wait(timeout=min(wait_time, self._max_feed_wait))
+            wakeup.clear()  # before checking, so that no wakeup is lost
+            if future.done() or connection_observer.done():
+                self._cancel_submitted_future(connection_observer, future)
+                return True
+            timeout = connection_observer.timeout
+            if timeout is None:  # unlimited lifetime - wait till observer is done
+                eol_remain_time = remain_time = float('inf')
+                continue
+            already_passed = _monotonic() - start_mono
+            eol_timeout = timeout + connection_observer.life_status.terminating_timeout
+            eol_remain_time = eol_timeout - already_passed
+            remain_time = timeout - already_passed
+            if remain_time <= 0.0:
+                self._wait_for_time_out(connection_observer, connection_observer_future,
+                                        timeout=await_timeout)
+                if not connection_observer.life_status.in_terminating:
+                    connection_observer.life_status.in_terminating = True
+        return False
+
     def _wait_for_not_started_connection_observer_is_done(self, connection_observer):
         # Have to wait till connection_observer is done with terminaing timeout.
         eol_remain_time = connection_observer.life_status.terminating_timeout
-        start_time = time.time()
+        start_time = _monotonic()
         while not connection_observer.done() and eol_remain_time > 0.0:
             time.sleep(self._tick)
-            eol_remain_time = start_time + connection_observer.life_status.terminating_timeout - time.time()
+            eol_remain_time = start_time + connection_observer.life_status.terminating_timeout - _monotonic()
 
     def _end_of_life_of_future_and_connection_observer(self, connection_observer, connection_observer_future):
         future = connection_observer_future or connection_observer._future
@@ -420,24 +561,28 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
         :param connection_observer_future: Future of connection-observer returned from submit().
         :return: iterator
         """
-        while not connection_observer_future.done():
-            yield None
-        # return result_for_runners(connection_observer)  # May raise too.   # Python > 3.3
-        res = result_for_runners(connection_observer)
-        raise StopIteration(res)  # Python 2 compatibility
+        return FutureResultIterator(connection_observer, connection_observer_future)
 
-    def _start_feeding(self, connection_observer, observer_lock):
+    def _start_feeding(self, connection_observer, observer_lock, feed_wakeup=None):
         """
         Start feeding connection_observer by establishing data-channel from connection to observer.
         """
+        # bound once - secure_data_received() is called for each chunk of data
+        observer_done = connection_observer.done
+        observer_data_received = connection_observer.data_received
+        life_status = connection_observer.life_status
+        current_time = time.time
 
         def secure_data_received(data, timestamp):
             try:
-                if connection_observer.done() or self._in_shutdown:
+                if observer_done() or self._in_shutdown:
                     return  # even not unsubscribed secure_data_received() won't pass data to done observer
                 with observer_lock:
-                    connection_observer.data_received(data, timestamp)
-                    connection_observer.life_status.last_feed_time = time.time()
+                    inactivity_timeout = life_status.inactivity_timeout
+                    observer_data_received(data, timestamp)
+                    life_status.last_feed_time = current_time()
+                    if (feed_wakeup is not None) and (inactivity_timeout != life_status.inactivity_timeout):
+                        feed_wakeup.set()  # let feed loop recalculate time of inactivity check
 
             except Exception as exc:  # TODO: handling stacktrace
                 # observers should not raise exceptions during data parsing
@@ -453,11 +598,16 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                         ex = MolerException(ex_msg)
                     connection_observer.set_exception(ex)
             finally:
-                if connection_observer.done() and not connection_observer.cancelled():
-                    if connection_observer._exception:
-                        self.logger.debug("{} raised: {!r}".format(connection_observer, connection_observer._exception))
-                    else:
-                        self.logger.debug("{} returned: {}".format(connection_observer, connection_observer._result))
+                if observer_done():
+                    if feed_wakeup is not None:
+                        feed_wakeup.set()  # let feed loop finish now
+                    if not connection_observer.cancelled():
+                        if connection_observer._exception:
+                            self.logger.debug("{} raised: {!r}".format(connection_observer,
+                                                                      connection_observer._exception))
+                        else:
+                            self.logger.debug("{} returned: {}".format(connection_observer,
+                                                                      connection_observer._result))
 
         moler_conn = connection_observer.connection
         self.logger.debug("subscribing for data {}".format(connection_observer))
@@ -488,33 +638,47 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
 
     def _feed_finish_callback(self, future, connection_observer, subscribed_data_receiver, feed_done, observer_lock):
         """Callback attached to concurrent.futures.Future of submitted feed()"""
+        if future.cancelled() and not connection_observer.done():
+            # feed() cancelled before it started (runner shutdown) so it couldn't cancel observer by itself
+            with observer_lock:
+                connection_observer.cancel()
+        self._feed_wakeups.pop(id(connection_observer), None)
         self._stop_feeding(connection_observer, subscribed_data_receiver, feed_done, observer_lock)
 
     def feed(self, connection_observer, subscribed_data_receiver, stop_feeding, feed_done,
-             observer_lock):
+             observer_lock, feed_wakeup=None):
         """
         Feeds connection_observer by transferring data from connection and passing it to connection_observer.
         Should be called from background-processing of connection observer.
         """
-        remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
-                                              from_start_time=connection_observer.life_status.start_time)
-        self.logger.debug("thread started  for {}, {}".format(connection_observer, msg))
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # don't build messages nobody will see
+        if debug_enabled:
+            remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
+                                                  from_start_time=connection_observer.life_status.start_time)
+            self.logger.debug("thread started  for {}, {}".format(connection_observer, msg))
 
+        if feed_wakeup is None:
+            feed_wakeup = threading.Event()
         if not subscribed_data_receiver:
-            subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
-
-        time.sleep(self._tick)  # give control back before we start processing
+            subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock, feed_wakeup)
 
-        self._feed_loop(connection_observer, stop_feeding, observer_lock)
+        self._feed_wakeups[id(connection_observer)] = feed_wakeup
+        try:
+            self._feed_loop(connection_observer, stop_feeding, observer_lock, feed_wakeup)
+        finally:
+            self._feed_wakeups.pop(id(connection_observer), None)
 
-        remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
-                                              from_start_time=connection_observer.life_status.start_time)
-        self.logger.debug("thread finished for {}, {}".format(connection_observer, msg))
+        if debug_enabled:
+            remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
+                                                  from_start_time=connection_observer.life_status.start_time)
+            self.logger.debug("thread finished for {}, {}".format(connection_observer, msg))
         self._stop_feeding(connection_observer, subscribed_data_receiver, feed_done, observer_lock)
         return None
 
-    def _feed_loop(self, connection_observer, stop_feeding, observer_lock):
-        start_time = connection_observer.life_status.start_time
+    def _feed_loop(self, connection_observer, stop_feeding, observer_lock, feed_wakeup):
+        life_status = connection_observer.life_status
+        # observer's start_time is wall-clock one; count further on monotonic clock (immune to clock jumps)
+        start_time = _monotonic() - (time.time() - life_status.start_time)
         while True:
             if stop_feeding.is_set():
                 # TODO: should it be renamed to 'cancelled' to be in sync with initial action?
@@ -523,15 +687,13 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
             if connection_observer.done():
                 self.logger.debug("done {}".format(connection_observer))
                 break
-            current_time = time.time()
-            run_duration = current_time - start_time
-            # we need to check connection_observer.timeout at each round since timeout may change
+            run_duration = _monotonic() - start_time
+            # we need to read connection_observer.timeout at each wakeup since timeout may change
             # during lifetime of connection_observer
-            timeout = connection_observer.timeout
-            if connection_observer.life_status.in_terminating:
-                timeout = connection_observer.life_status.terminating_timeout
+            in_terminating = life_status.in_terminating
+            timeout = life_status.terminating_timeout if in_terminating else connection_observer.timeout
             if (timeout is not None) and (run_duration >= timeout):
-                if connection_observer.life_status.in_terminating:
+                if in_terminating:
                     msg = "{} underlying real command failed to finish during {} seconds. It will be forcefully" \
                           " terminated".format(connection_observer, timeout)
                     self.logger.info(msg)
@@ -539,21 +701,47 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                 else:
                     with observer_lock:
                         time_out_observer(connection_observer,
-                                          timeout=connection_observer.timeout,
+                                          timeout=timeout,
                                           passed_time=run_duration,
                                           runner_logger=self.logger)
-                        if connection_observer.life_status.terminating_timeout >= 0.0:
-                            start_time = time.time()
-                            connection_observer.life_status.in_terminating = True
+                        if life_status.terminating_timeout >= 0.0:
+                            start_time = _monotonic()
+                            life_status.in_terminating = True
+                            timeout = life_status.terminating_timeout
                         else:
                             break
             else:
-                self._call_on_inactivity(connection_observer=connection_observer, current_time=current_time)
+                self._call_on_inactivity(connection_observer=connection_observer, current_time=time.time())
 
             if self._in_shutdown:
                 self.logger.debug("shutdown so cancelling {}".format(connection_observer))
                 connection_observer.cancel()
-            time.sleep(self._tick)  # give moler_conn a chance to feed observer
+                continue
+            # sleep till something to check: stop, observer done, timeout or inactivity (no busy polling)
+            self._wait_for_feed_wakeup(life_status, feed_wakeup, start_time, timeout)
+
+    def _wait_for_feed_wakeup(self, life_status, feed_wakeup, start_time, timeout):
+        """
+        Sleep till feed_wakeup is set or time of next check of connection_observer comes.
+
+        :param life_status: ConnectionObserverLifeStatus of connection_observer fed by loop.
+        :param feed_wakeup: event set when feed loop should check connection_observer immediately.
+        :param start_time: monotonic time from which timeout of connection_observer is counted in feed loop.
+        :param timeout: current timeout of connection_observer (None if no timeout).
+        :return: None
+        """
+        wait_time = self._max_feed_wait  # observer may become done without runner knowing (like user cancel())
+        if timeout is not None:
+            wait_time = min(wait_time, start_time + timeout - _monotonic())
+        if (life_status.inactivity_timeout > 0.0) and (life_status.last_feed_time is not None):
+            wait_time = min(wait_time, life_status.last_feed_time + life_status.inactivity_timeout - time.time())
+        if wait_time > 0.0:
+            feed_wakeup.wait(timeout=wait_time)
+        feed_wakeup.clear()
+
+    def _wakeup_feed_loops(self):
+        for feed_wakeup in list(self._feed_wakeups.values()):
+            feed_wakeup.set()
 
     def _call_on_inactivity(self, connection_observer, current_time):
         """
@@ -571,7 +759,27 @@ class ThreadPoolExecutorRunner(ConnectionObserverRunner):
                 connection_observer.life_status.last_feed_time = current_time
 
     def timeout_change(self, timedelta):
-        pass
+        """
+        Wake up running feed loops so that they recalculate time remaining till timeout of their observers.
+
+        :param timedelta: delta timeout in float seconds
+        :return: None
+        """
+        self._wakeup_feed_loops()
+
+    def observer_change(self, connection_observer):
+        """
+        Wake up feed loop and wait_for() of observer so that they check observer's done-status and timeout.
+
+        :param connection_observer: The one that has changed.
+        :return: None
+        """
+        feed_wakeup = self._feed_wakeups.get(id(connection_observer))
+        if feed_wakeup is not None:
+            feed_wakeup.set()
+        wait_for_wakeup = self._wait_for_wakeups.get(id(connection_observer))
+        if wait_for_wakeup is not None:
+            wait_for_wakeup.set()
 
 
 # utilities to be used by runners
@@ -583,10 +791,12 @@ def his_remaining_time(prefix, timeout, from_start_time):
 
     :param prefix: string to be used inside 'remaining time description'
     :param he: object to calculate remaining time for
-    :param timeout: max lifetime of object
+    :param timeout: max lifetime of object (None means unlimited lifetime)
     :param from_start_time: start of lifetime for the object
     :return: remaining time as float and related description message
     """
+    if timeout is None:
+        return float('inf'), prefix + " unlimited time"
     already_passed = time.time() - from_start_time
     remain_time = timeout - already_passed
     if remain_time < 0.0:
@@ -608,13 +818,18 @@ def await_future_or_eol(connection_observer, remain_time, start_time, timeout, l
             break
         now = time.time()
         already_passed = now - start_time
-        remain_time = timeout - already_passed
-        observer_lifetime_passed = now - connection_observer.life_status.start_time
-        remain_observer_lifetime = connection_observer.timeout + connection_observer.life_status.terminating_timeout\
-            - observer_lifetime_passed
-        # we timeout on earlier timeout (timeout or connection_observer.timeout)
-        if remain_observer_lifetime <= 0.0:
-            remain_time = 0.0
+        if timeout is None:  # unlimited lifetime
+            remain_time = float('inf')
+        else:
+            remain_time = timeout - already_passed
+        observer_timeout = connection_observer.timeout
+        if observer_timeout is not None:
+            observer_lifetime_passed = now - connection_observer.life_status.start_time
+            remain_observer_lifetime = observer_timeout + connection_observer.life_status.terminating_timeout \
+                - observer_lifetime_passed
+            # we timeout on earlier timeout (timeout or connection_observer.timeout)
+            if remain_observer_lifetime <= 0.0:
+                remain_time = 0.0
         if remain_time <= 0.0:
             logger.debug("{} timeout before creating future".format(connection_observer))
 
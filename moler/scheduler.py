@@ -4,11 +4,14 @@ __author__ = 'Marcin Usielski, Michal Ernst'
 __copyright__ = 'Copyright (C) 2018-2019, Nokia'
 __email__ = 'marcin.usielski@nokia.com, michal.ernst@nokia.com'
 
+import heapq
+import itertools
 import logging
 import threading
+import time
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.schedulers.background import BackgroundScheduler
+from concurrent.futures import ThreadPoolExecutor
 
 from moler.exceptions import WrongUsage
 from moler.helpers import ForwardingHandler
@@ -29,8 +32,10 @@ class Scheduler(object):
         :param cancel_on_exception: set True if you want to break next execution of this callback if previous raises an
          exception
         :param int misfire_grace_time: seconds after the designated runtime that the job is still allowed to be run
-        :return: Instance of Job.
+        :return: Instance of Job. If interval is not positive then it raises ValueError.
         """
+        if not interval > 0:
+            raise ValueError("Wrong value of 'interval': '{}'. It must be greater than 0".format(interval))
         instance = Scheduler._get_instance()
         decorated = DecoratedCallable(callback, cancel_on_exception)
 
@@ -61,12 +66,17 @@ class Scheduler(object):
         """
         :return: Instance of scheduler
         """
-        if Scheduler._object is None:
-            Scheduler()
-        return Scheduler._object
+        instance = Scheduler._object  # fast path without locking - scheduler is created only once
+        if instance is None:
+            with Scheduler._instance_lock:
+                if Scheduler._object is None:  # other thread might create it while we were waiting for lock
+                    Scheduler()
+                instance = Scheduler._object
+        return instance
 
     _object = None
     _lock = threading.Lock()
+    _instance_lock = threading.Lock()  # guards creation of instance by _get_instance()
 
     def __init__(self, scheduler_type=None):
         """
@@ -157,16 +167,187 @@ class Job(object):
 moler_scheduler = "moler.scheduler"
 
 
-class MolerThreadScheduler(BackgroundScheduler):
-    forwarding_handler = None
+class MolerThreadScheduler(object):
+    """
+    Interval jobs scheduler running in single background thread.
 
-    def _configure(self, config):
-        super(MolerThreadScheduler, self)._configure(config)
-        if not MolerThreadScheduler.forwarding_handler:
-            self._logger.propagate = False
-            self._logger.setLevel(1)
-            MolerThreadScheduler.forwarding_handler = ForwardingHandler(target_logger_name=moler_scheduler)
-            self._logger.addHandler(MolerThreadScheduler.forwarding_handler)
+    It implements that part of apscheduler API which is used by Scheduler (add_job() of 'interval' jobs,
+    pause()/resume() of job, remove_all_jobs(), start(), shutdown()). Due jobs are kept in heap ordered by next
+    run time, so timer thread sleeps till the nearest one. Callbacks are run by thread pool, as in apscheduler
+    max. one instance of job may run at once and missed runs are coalesced into single run.
+    """
+    _now = getattr(time, "monotonic", time.time)
+
+    def __init__(self, max_workers=10):
+        """
+        :param max_workers: max. number of threads running callbacks of jobs.
+        """
+        super(MolerThreadScheduler, self).__init__()
+        self._logger = logging.getLogger(moler_scheduler)
+        self._heap = []  # (next_run_time, sequence_nb, job, job_token)
+        self._sequence = itertools.count()  # to not compare jobs scheduled at same time
+        self._cv = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._max_workers = max_workers
+        self._running = False
+
+    def add_job(self, func, trigger, seconds, misfire_grace_time=1, kwargs=None):
+        """
+        Add job called each 'seconds'.
+
+        :param func: callable to call.
+        :param trigger: kind of trigger, only 'interval' is supported.
+        :param seconds: interval in float seconds (greater than 0).
+        :param misfire_grace_time: seconds after the designated run time that the job is still allowed to be run.
+        :param kwargs: dict of params of func.
+        :return: instance of _IntervalJob.
+        """
+        if trigger != 'interval':
+            raise WrongUsage("Wrong value of 'trigger': '{}'. Allowed is 'interval'".format(trigger))
+        if not seconds > 0:
+            raise ValueError("Wrong value of 'seconds': '{}'. It must be greater than 0".format(seconds))
+        job = _IntervalJob(scheduler=self, func=func, interval=seconds, misfire_grace_time=misfire_grace_time,
+                           kwargs=kwargs, start_time=self._now() + seconds)
+        self._schedule(job)
+        return job
+
+    def start(self):
+        """
+        Start timer thread.
+
+        :return: None
+        """
+        with self._cv:
+            if self._running:
+                return
+            self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            self._thread = threading.Thread(target=self._loop, name="MolerThreadScheduler")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def shutdown(self):
+        """
+        Stop timer thread. Already running callbacks are not awaited.
+
+        :return: None
+        """
+        with self._cv:
+            self._running = False
+            self._cv.notify()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def remove_all_jobs(self):
+        """
+        Remove all scheduled jobs.
+
+        :return: None
+        """
+        with self._cv:
+            for _, _, job, _ in self._heap:
+                job.paused = True
+            self._heap = []
+            self._cv.notify()
+
+    def _schedule(self, job):
+        with self._cv:
+            job.token += 1  # entries of previous schedules of job become tombstones
+            heapq.heappush(self._heap, (job.next_run_time, next(self._sequence), job, job.token))
+            self._cv.notify()
+
+    def _pause(self, job):
+        with self._cv:
+            job.paused = True
+            job.token += 1
+
+    def _resume(self, job):
+        with self._cv:
+            if not job.paused:
+                return
+            job.paused = False
+            job.next_run_time = job.get_next_run_time(self._now())
+            self._schedule(job)
+
+    def _loop(self):
+        with self._cv:
+            while self._running:
+                if not self._heap:
+                    self._cv.wait()
+                    continue
+                run_time, _, job, token = self._heap[0]
+                if job.paused or (token != job.token):
+                    heapq.heappop(self._heap)
+                    continue
+                now = self._now()
+                if run_time > now:
+                    self._cv.wait(run_time - now)
+                    continue
+                heapq.heappop(self._heap)
+                self._run_job(job, now)
+                job.next_run_time = job.get_next_run_time(now)
+                heapq.heappush(self._heap, (job.next_run_time, next(self._sequence), job, job.token))
+
+    def _run_job(self, job, now):
+        last_run_time = job.get_last_run_time(now)  # missed runs are coalesced
+        if now - last_run_time > job.misfire_grace_time:
+            self._logger.warning("Run time of job {} was missed by {:.3f} s".format(job, now - last_run_time))
+        elif job.is_running:
+            self._logger.warning("Execution of job {} skipped: maximum number of running instances reached (1)".format(
+                job))
+        else:
+            job.is_running = True
+            self._executor.submit(job.run)
+
+
+class _IntervalJob(object):
+    def __init__(self, scheduler, func, interval, misfire_grace_time, kwargs, start_time):
+        self._scheduler = scheduler
+        self.func = func
+        self.interval = interval
+        self.misfire_grace_time = misfire_grace_time
+        self.kwargs = kwargs or {}
+        self.start_time = start_time
+        self.next_run_time = start_time
+        self.paused = False
+        self.is_running = False
+        self.token = 0
+
+    def __str__(self):
+        return "{}(interval={})".format(self.func, self.interval)
+
+    def pause(self):
+        self._scheduler._pause(self)
+
+    def resume(self):
+        self._scheduler._resume(self)
+
+    def get_last_run_time(self, now):
+        """
+        :param now: current time.
+        :return: latest designated run time not later than now.
+        """
+        if now < self.start_time:
+            return self.start_time
+        return self.start_time + int((now - self.start_time) / self.interval) * self.interval
+
+    def get_next_run_time(self, now):
+        """
+        :param now: current time.
+        :return: first designated run time later than now.
+        """
+        if now < self.start_time:
+            return self.start_time
+        return self.get_last_run_time(now) + self.interval
+
+    def run(self):
+        try:
+            self.func(**self.kwargs)
+        except Exception:
+            self._scheduler._logger.exception("Job {} raised exception".format(self))
+        finally:
+            self.is_running = False
 
 
 class MolerAsyncioScheduler(AsyncIOScheduler):
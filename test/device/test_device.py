@@ -81,6 +81,76 @@ def test_device_unix_can_return_cd_command(configure_net_1_connection):
     )
 
 
+def test_device_caches_loaded_observer_classes(configure_net_1_connection):
+    from moler.device.textualdevice import TextualDevice
+    from moler.device.unixlocal import UnixLocal
+    from moler.cmd.unix.cd import Cd
+
+    ux = UnixLocal.from_named_connection(connection_name='net_1')
+    ux.establish_connection()
+    cmd1 = ux.get_cmd(cmd_name='cd', cmd_params={"path": "/home/user/"})
+    assert TextualDevice._observer_classes['moler.cmd.unix.cd.Cd'] is Cd
+    cmd2 = ux.get_cmd(cmd_name='cd', cmd_params={"path": "/tmp/"})
+    assert cmd1 is not cmd2
+    assert isinstance(cmd2, Cd)
+
+
+def test_device_scans_observers_package_only_once(buffer_connection):
+    import mock
+    from moler.device.textualdevice import TextualDevice
+    from moler.device.unixlocal import UnixLocal
+
+    dev1 = UnixLocal(io_connection=buffer_connection)
+    cmds1 = dev1._load_cmds_from_package('moler.cmd.unix')
+    assert 'moler.cmd.unix' in TextualDevice._observers_in_packages
+    dev2 = UnixLocal(io_connection=buffer_connection)
+    with mock.patch.object(dev2, '_scan_package_for_cmds') as scan:
+        cmds2 = dev2._load_cmds_from_package('moler.cmd.unix')
+    assert not scan.called
+    assert cmds1 == cmds2
+    assert cmds1 is not cmds2
+
+
+def test_device_lazy_loads_observers_only_for_used_state(configure_net_1_connection):
+    from moler.device.unixlocal import UnixLocal
+    from moler.cmd.unix.cd import Cd
+
+    ux = UnixLocal.from_named_connection(connection_name='net_1')
+    ux.lazy_cmds_events = True
+    ux.establish_connection()
+    assert ux._cmdnames_available_in_state[ux.current_state] is None
+    del ux._cmdnames_available_in_state[ux.current_state]  # state unknown when connection was established
+    assert isinstance(ux.get_cmd(cmd_name='cd', cmd_params={"path": "/home/user/"}), Cd)
+    assert 'cd' in ux._cmdnames_available_in_state[ux.current_state]
+    for state in ux._cmdnames_available_in_state:
+        if state != ux.current_state:
+            assert ux._cmdnames_available_in_state[state] is None
+
+
+def test_device_raises_when_command_started_in_other_state(configure_net_1_connection):
+    from moler.device.unixlocal import UnixLocal
+    from moler.exceptions import CommandWrongState
+
+    ux = UnixLocal.from_named_connection(connection_name='net_1')
+    ux.establish_connection()
+    cmd = ux.get_cmd(cmd_name='cd', cmd_params={"path": "/home/user/"}, for_state="UNIX_LOCAL_ROOT")
+    with pytest.raises(CommandWrongState):
+        cmd.start()
+
+
+def test_device_asks_for_packages_of_state_only_once(buffer_connection):
+    import mock
+    from moler.device.unixlocal import UnixLocal
+
+    dev = UnixLocal(io_connection=buffer_connection)
+    with mock.patch.object(dev, '_get_packages_for_state', return_value=['moler.cmd.unix']) as get_packages:
+        cmds1 = dev._collect_cmds_for_state(state="UNIX_LOCAL")
+        cmds2 = dev._collect_cmds_for_state(state="UNIX_LOCAL")
+    assert 1 == get_packages.call_count
+    assert 'ls' in cmds1
+    assert cmds1 == cmds2
+
+
 # --------------------------- resources ---------------------------
 
 
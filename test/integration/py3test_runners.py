@@ -622,6 +622,44 @@ async def test_can_async_await_connection_observer_to_complete(observer_and_awai
     assert future.result() is None
 
 
+def test_awaiting_observer_of_thread_pool_runner_sleeps_on_asyncio_future():
+    # no pytest-asyncio needed - we drive event loop ourselves
+    from moler.runner import ThreadPoolExecutorRunner, FutureResultIterator
+    from moler.threaded_moler_connection import ThreadedMolerConnection
+
+    runner = ThreadPoolExecutorRunner()
+    moler_conn = ThreadedMolerConnection()
+    connection_observer = NetworkDownDetector(connection=moler_conn, runner=runner)
+    connection_observer.life_status.start_time = time.time()
+    connection_observer._future = runner.submit(connection_observer)
+    connection_observer.timeout = 1
+
+    yielded_waiters = []
+    original_get_waiter = FutureResultIterator._get_waiter
+
+    def get_waiter(self):
+        waiter = original_get_waiter(self)
+        yielded_waiters.append(waiter)
+        return waiter
+
+    async def await_observer():
+        return await connection_observer
+
+    event_loop = asyncio.new_event_loop()
+    event_loop.call_later(0.2, moler_conn.data_received,
+                          'ping: sendmsg: Network is unreachable', datetime.datetime.now())
+    with mock.patch.object(FutureResultIterator, "_get_waiter", get_waiter):
+        result = event_loop.run_until_complete(await_observer())
+    event_loop.close()
+
+    assert connection_observer.done()
+    assert result == connection_observer.result()
+    # awaiting task was sleeping on asyncio future woken by done-callback, not busy-spinning
+    assert 1 <= len(yielded_waiters) <= 2
+    assert all(asyncio.isfuture(waiter) for waiter in yielded_waiters)
+    runner.shutdown()
+
+
 # --------------------------------------------------------------------
 # Testing correct usage
 #
@@ -43,6 +43,66 @@ def test_can_create_passive_sshshell_connection_using_same_api(passive_sshshell_
     assert "Use either 'username' or 'login', not both" in str(err.value)
 
 
+def test_ssh_client_is_created_on_first_use(passive_sshshell_connection_class):
+    connection = passive_sshshell_connection_class(host='localhost', port=22,
+                                                   username='molerssh', password='moler_password')
+    assert connection._ssh_client is None
+    assert connection._ssh_transport is None
+    assert connection._ssh_client is None
+
+    new_connection = passive_sshshell_connection_class.from_sshshell(sshshell=connection)
+    assert connection._ssh_client is not None
+    assert new_connection.ssh_client is connection.ssh_client
+
+
+def test_connections_with_share_transport_reuse_transport_of_same_host(passive_sshshell_connection_class):
+    class FakeSshClient(object):
+        created = []
+
+        def __init__(self):
+            self.transport = None
+            self.channels_nb = 0
+            FakeSshClient.created.append(self)
+
+        def set_missing_host_key_policy(self, policy):
+            pass
+
+        def connect(self, host, username, password):
+            self.transport = mock.MagicMock()
+            self.transport.is_active.return_value = True
+
+        def get_transport(self):
+            return self.transport
+
+        def invoke_shell(self):
+            self.channels_nb += 1
+            channel = mock.MagicMock()
+            channel.get_transport.return_value = self.transport
+            channel.get_id.return_value = self.channels_nb
+            return channel
+
+        def close(self):
+            self.transport = None
+
+    with mock.patch("paramiko.SSHClient", FakeSshClient):
+        conn1 = passive_sshshell_connection_class(host='localhost', username='molerssh', share_transport=True)
+        conn2 = passive_sshshell_connection_class(host='localhost', username='molerssh', share_transport=True)
+        conn3 = passive_sshshell_connection_class(host='localhost', username='molerssh')
+        conn1.open()
+        conn2.open()
+        conn3.open()
+        assert 2 == len(FakeSshClient.created)
+        assert conn1._ssh_transport is conn2._ssh_transport
+        assert conn1._ssh_transport is not conn3._ssh_transport
+        conn3.close()
+
+        conn1.close()
+        assert conn2._ssh_transport is not None  # still used by conn2
+        conn2.close()
+        assert conn2._ssh_transport is None
+        assert ('localhost', 22, 'molerssh') not in passive_sshshell_connection_class._shared_ssh_clients
+
+
 def test_can_create_active_sshshell_connection_using_same_api(active_sshshell_connection_class):
     # we want to have all connections of class 'active sshshell' to share same API
 
@@ -267,3 +267,36 @@ def test_convert_to_int():
                                              'num': 4}}}]}
 
     assert not compare_objects(convert_to_int(sample_input), expected_output)
+
+
+def test_effective_cpu_count_is_limited_by_cpu_affinity():
+    from moler.helpers import effective_cpu_count
+
+    with mock.patch("os.sched_getaffinity", return_value={0, 3}, create=True):
+        with mock.patch("multiprocessing.cpu_count", return_value=64):
+            assert effective_cpu_count() == 2
+
+
+def test_effective_cpu_count_falls_back_to_cpu_count_without_cpu_affinity(monkeypatch):
+    import os
+    from moler.helpers import effective_cpu_count
+
+    monkeypatch.delattr(os, "sched_getaffinity", raising=False)  # like on Windows, MacOS or Python 2
+    with mock.patch("multiprocessing.cpu_count", return_value=6):
+        assert effective_cpu_count() == 6
+
+
+def test_effective_cpu_count_falls_back_to_cpu_count_when_cpu_affinity_is_not_supported():
+    from moler.helpers import effective_cpu_count
+
+    with mock.patch("os.sched_getaffinity", side_effect=OSError, create=True):
+        with mock.patch("multiprocessing.cpu_count", return_value=6):
+            assert effective_cpu_count() == 6
+
+
+def test_effective_cpu_count_returns_one_if_cpu_count_is_unknown():
+    from moler.helpers import effective_cpu_count
+
+    with mock.patch("os.sched_getaffinity", side_effect=OSError, create=True):
+        with mock.patch("multiprocessing.cpu_count", side_effect=NotImplementedError):
+            assert effective_cpu_count() == 1
@@ -77,6 +77,21 @@ def test_multiline_formatter_puts_direction_info_into_direction_area():
     assert output == "01 19:36:09.823  |just log"
 
 
+def test_main_formatter_formats_message_args_before_prefixing_log_name():
+    from moler.config.loggers import MolerMainMultilineWithDirectionFormatter
+
+    formatter = MolerMainMultilineWithDirectionFormatter(fmt="%(asctime)s.%(msecs)03d %(levelname)-12s %(message)s",
+                                                         datefmt="%d %H:%M:%S")
+    tm_struct = time.strptime("2000-01-01 19:36:09", "%Y-%m-%d %H:%M:%S")
+    logging_time = time.mktime(tm_struct)
+
+    log_rec = logging.makeLogRecord({'msg': "state %s -> %s", 'args': ("UNIX_LOCAL", "PROXY_PC"),
+                                     'created': logging_time, 'msecs': 823, 'levelname': "INFO",
+                                     'log_name': "DEV%s"})
+    output = formatter.format(log_rec)
+    assert output == "01 19:36:09.823 INFO         DEV%s               |state UNIX_LOCAL -> PROXY_PC"
+
+
 def test_RawFileHandler_appends_binary_message_into_logfile():
     import os.path
     from moler.config.loggers import RAW_DATA, RawFileHandler
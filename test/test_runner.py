@@ -89,6 +89,61 @@ def test_runner_doesnt_impact_unrised_observer_exception_while_taking_observer_r
         assert timeout in ConnectionObserver._not_raised_exceptions
 
 
+def test_his_remaining_time_of_unlimited_lifetime():
+    from moler.runner import his_remaining_time
+
+    remain_time, msg = his_remaining_time("remaining", timeout=None, from_start_time=time.time())
+    assert remain_time == float('inf')
+    assert msg == "remaining unlimited time"
+
+
+def test_ThreadPoolExecutorRunner_wait_for_observer_with_unlimited_timeout(connection_observer):
+    import datetime
+    import threading
+    from moler.runner import ThreadPoolExecutorRunner
+
+    runner = ThreadPoolExecutorRunner()
+    runner._max_feed_wait = 0.05  # many wakeups of wait_for() before observer is done
+    connection_observer.runner = runner
+    connection_observer.life_status.timeout = None
+    connection_observer.life_status.start_time = time.time()
+    future = runner.submit(connection_observer)
+    network_down = threading.Timer(0.3, connection_observer.connection.data_received,
+                                   args=("ping: sendmsg: Network is unreachable", datetime.datetime.now()))
+    network_down.start()
+    runner.wait_for(connection_observer, future)
+    network_down.join()
+    assert connection_observer.done()
+    assert connection_observer.result() is not None
+    runner.shutdown()
+
+
+def test_ThreadPoolExecutorRunner_wait_for_returns_promptly_when_not_fed_observer_gets_result(connection_observer):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from moler.runner import ThreadPoolExecutorRunner
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    release_executor = threading.Event()
+    executor.submit(release_executor.wait, 5)  # occupy only worker - feed of observer can't start
+    runner = ThreadPoolExecutorRunner(executor=executor)
+    connection_observer.runner = runner
+    connection_observer.timeout = 10
+    connection_observer.life_status.start_time = time.time()
+    future = runner.submit(connection_observer)
+    external_result = threading.Timer(0.1, connection_observer.set_result, args=("network down",))
+    external_result.start()
+    start_time = time.time()
+    runner.wait_for(connection_observer, future)
+    wait_duration = time.time() - start_time
+    external_result.join()
+    release_executor.set()
+    assert connection_observer.result() == "network down"
+    assert wait_duration < 0.5  # not waiting for safety-net wakeup of wait_for()
+    runner.shutdown()
+    executor.shutdown()
+
+
 def test_CancellableFuture_str_casting_shows_embedded_future():
     import threading
     from moler.runner import CancellableFuture
@@ -139,6 +194,20 @@ def test_CancellableFuture_can_force_cancel_of_embedded_future():
     assert "Failed to stop thread-running function within 0.2 sec" in str(exc.value)
 
 
+def test_FutureResultIterator_stops_iteration_with_observer_result(connection_observer):
+    from concurrent.futures import Future
+    from moler.runner import FutureResultIterator
+
+    future = Future()
+    iterator = FutureResultIterator(connection_observer, future)
+    assert next(iterator) is None  # not driven by asyncio loop
+    connection_observer.set_result("network down")
+    future.set_result(None)
+    with pytest.raises(StopIteration) as stop:
+        next(iterator)
+    assert stop.value.args[0] == "network down"
+
+
 def test_ThreadPoolExecutorRunner_logs_about_reused_executor():
     import logging
     from concurrent.futures import ThreadPoolExecutor
@@ -153,6 +222,61 @@ def test_ThreadPoolExecutorRunner_logs_about_reused_executor():
     external_executor.shutdown()
 
 
+def test_ThreadPoolExecutorRunner_feed_loop_wakes_up_when_observer_is_done_by_data(connection_observer):
+    import datetime
+    from concurrent.futures import wait
+    from moler.runner import ThreadPoolExecutorRunner
+
+    runner = ThreadPoolExecutorRunner()
+    runner._max_feed_wait = 10  # only wakeup event may finish loop before timeout
+    connection_observer.timeout = 10
+    connection_observer.life_status.start_time = time.time()
+    future = runner.submit(connection_observer)
+    time.sleep(0.1)  # let feed loop start waiting
+    connection_observer.connection.data_received("ping: sendmsg: Network is unreachable", datetime.datetime.now())
+    done, not_done = wait([future._future], timeout=1)
+    assert connection_observer.done()
+    assert future._future in done
+    runner.shutdown()
+
+
+def test_ThreadPoolExecutorRunner_feed_loop_wakes_up_when_observer_timeout_is_shortened(connection_observer):
+    from concurrent.futures import wait
+    from moler.runner import ThreadPoolExecutorRunner
+    from moler.exceptions import ConnectionObserverTimeout
+
+    runner = ThreadPoolExecutorRunner()
+    runner._max_feed_wait = 10  # only wakeup event may finish loop before timeout
+    connection_observer.runner = runner
+    connection_observer.timeout = 10
+    connection_observer.terminating_timeout = 0.0
+    connection_observer.life_status.start_time = time.time()
+    future = runner.submit(connection_observer)
+    time.sleep(0.1)  # let feed loop start waiting
+    connection_observer.extend_timeout(-9.8)
+    done, not_done = wait([future._future], timeout=1)
+    assert connection_observer.done()
+    assert isinstance(connection_observer._exception, ConnectionObserverTimeout)
+    runner.shutdown()
+
+
+def test_ThreadPoolExecutorRunner_feed_loop_wakes_up_when_observer_is_cancelled(connection_observer):
+    from concurrent.futures import wait
+    from moler.runner import ThreadPoolExecutorRunner
+
+    runner = ThreadPoolExecutorRunner()
+    runner._max_feed_wait = 10  # only wakeup event may finish loop before timeout
+    connection_observer.runner = runner
+    connection_observer.timeout = 10
+    connection_observer.life_status.start_time = time.time()
+    connection_observer._future = future = runner.submit(connection_observer)
+    time.sleep(0.1)  # let feed loop start waiting
+    connection_observer.cancel()
+    done, not_done = wait([future._future], timeout=1)
+    assert future._future in done
+    runner.shutdown()
+
+
 # --------------------------- resources ---------------------------
 
 
@@ -6,11 +6,12 @@ __author__ = 'Marcin Usielski'
 __copyright__ = 'Copyright (C) 2018, Nokia'
 __email__ = 'marcin.usielski@nokia.com'
 
-from moler.scheduler import Scheduler
+from moler.scheduler import Scheduler, MolerThreadScheduler
 from moler.exceptions import WrongUsage
 from moler.util.moler_test import MolerTest
 import time
 import pytest
+import mock
 import sys
 
 try:
@@ -123,6 +124,69 @@ def test_cannot_create_more_objects():
         Scheduler()
 
 
+@pytest.mark.parametrize("interval", [0, -0.1])
+def test_job_with_not_positive_interval_is_rejected(interval):
+    with pytest.raises(ValueError):
+        Scheduler.get_job(callback=callback, interval=interval, callback_params={'param_dict': {'number': 0}})
+
+
+def test_thread_scheduler_doesnt_run_paused_job_and_runs_resumed_one():
+    scheduler = MolerThreadScheduler()
+    scheduler.start()
+    values = {'number': 0}
+    job = scheduler.add_job(callback, 'interval', seconds=0.05, kwargs={'param_dict': values})
+    job.pause()
+    time.sleep(0.17)
+    assert 0 == values['number']
+    job.resume()
+    time.sleep(0.17)
+    job.pause()
+    number_at_pause = values['number']
+    time.sleep(0.12)
+    scheduler.shutdown()
+    assert 3 == number_at_pause
+    assert number_at_pause == values['number']
+
+
+def test_thread_scheduler_coalesces_missed_runs_into_next_single_run():
+    scheduler = MolerThreadScheduler()
+    job = scheduler.add_job(callback, 'interval', seconds=1.0, kwargs={'param_dict': {'number': 0}})
+    start_time = job.start_time
+    assert start_time == job.get_last_run_time(start_time - 0.5)
+    assert start_time == job.get_next_run_time(start_time - 0.5)
+    assert start_time + 3.0 == job.get_last_run_time(start_time + 3.5)  # runs 1, 2 and 3 missed - only 3 is run
+    assert start_time + 4.0 == job.get_next_run_time(start_time + 3.5)
+
+
+def test_thread_scheduler_skips_run_missed_by_more_than_misfire_grace_time():
+    scheduler = MolerThreadScheduler()
+    scheduler._executor = mock.MagicMock()
+    job = scheduler.add_job(callback, 'interval', seconds=1.0, misfire_grace_time=0.2,
+                            kwargs={'param_dict': {'number': 0}})
+    with mock.patch.object(scheduler._logger, "warning") as log_warning:
+        scheduler._run_job(job, now=job.start_time + 0.3)
+    assert not scheduler._executor.submit.called
+    assert "was missed by 0.300 s" in log_warning.call_args[0][0]
+
+    scheduler._run_job(job, now=job.start_time + 1.1)  # next designated run time is within grace time
+    scheduler._executor.submit.assert_called_once_with(job.run)
+
+
+def test_thread_scheduler_runs_max_one_instance_of_job():
+    scheduler = MolerThreadScheduler()
+    scheduler._executor = mock.MagicMock()
+    job = scheduler.add_job(callback, 'interval', seconds=1.0, kwargs={'param_dict': {'number': 0}})
+    scheduler._run_job(job, now=job.start_time)
+    with mock.patch.object(scheduler._logger, "warning") as log_warning:
+        scheduler._run_job(job, now=job.start_time + 1.0)  # previous run still not finished
+    scheduler._executor.submit.assert_called_once_with(job.run)
+    assert "maximum number of running instances reached" in log_warning.call_args[0][0]
+
+    job.run()  # finishing run allows next one
+    scheduler._run_job(job, now=job.start_time + 2.0)
+    assert 2 == scheduler._executor.submit.call_count
+
+
 def callback(param_dict):
     param_dict['number'] += 1
 